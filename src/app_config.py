@@ -0,0 +1,54 @@
+"""Application settings model shared by the CLI and the GUI (no Tk imports)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class AppSettings:
+    address: str = "192.168.61.110"
+    rack: int = 0
+    slot: int = 1
+    tcp_port: int = 102
+    db: int = 200
+    start: int = 0
+    size: int = 23970
+    interval_ms: int = 1000
+
+
+_INT_FIELDS = ("rack", "slot", "tcp_port", "db", "start", "size", "interval_ms")
+
+
+def coerce_settings(
+    *,
+    address: object,
+    rack: object,
+    slot: object,
+    tcp_port: object,
+    db: object,
+    start: object,
+    size: object,
+    interval_ms: object = AppSettings.interval_ms,
+) -> AppSettings:
+    """Build AppSettings from raw values (e.g. Tk variable strings or CLI args).
+
+    Raises ValueError naming the first field that is not an integer.
+    """
+
+    raw = {
+        "rack": rack,
+        "slot": slot,
+        "tcp_port": tcp_port,
+        "db": db,
+        "start": start,
+        "size": size,
+        "interval_ms": interval_ms,
+    }
+    values = {}
+    for name in _INT_FIELDS:
+        try:
+            values[name] = int(raw[name])
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be an integer, got {raw[name]!r}") from None
+    return AppSettings(address=str(address).strip(), **values)
@@ -1,5 +1,15 @@
-from .main_window import PLCReaderApp
-from .detail_window import DetailWindow
-
 __all__ = ["PLCReaderApp", "DetailWindow"]
 
+
+def __getattr__(name: str):
+    # Window classes pull in tkinter; load them on first use so importing a Tk-free
+    # submodule (e.g. gui.app_settings) does not require _tkinter
+    if name == "PLCReaderApp":
+        from .main_window import PLCReaderApp
+
+        return PLCReaderApp
+    if name == "DetailWindow":
+        from .detail_window import DetailWindow
+
+        return DetailWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,24 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from pathlib import Path
 import json
 import sys
 
+from app_config import AppSettings, coerce_settings
 
-SETTINGS_FILENAME = "settings.json"
+__all__ = [
+    "AppSettings",
+    "SETTINGS_FILENAME",
+    "coerce_settings",
+    "get_settings_path",
+    "load_settings",
+    "save_settings",
+]
 
 
-@dataclass
-class AppSettings:
-    address: str = "192.168.61.110"
-    rack: int = 0
-    slot: int = 1
-    tcp_port: int = 102
-    db: int = 200
-    start: int = 0
-    size: int = 23970
-    interval_ms: int = 1000
+SETTINGS_FILENAME = "settings.json"
 
 
 def get_settings_path() -> Path:
@@ -35,15 +34,15 @@ def load_settings() -> AppSettings:
     except Exception:
         data = {}
 
-    return AppSettings(
-        address=str(data.get("address", AppSettings.address)),
-        rack=int(data.get("rack", AppSettings.rack)),
-        slot=int(data.get("slot", AppSettings.slot)),
-        tcp_port=int(data.get("tcp_port", AppSettings.tcp_port)),
-        db=int(data.get("db", AppSettings.db)),
-        start=int(data.get("start", AppSettings.start)),
-        size=int(data.get("size", AppSettings.size)),
-        interval_ms=int(data.get("interval_ms", AppSettings.interval_ms)),
+    return coerce_settings(
+        address=data.get("address", AppSettings.address),
+        rack=data.get("rack", AppSettings.rack),
+        slot=data.get("slot", AppSettings.slot),
+        tcp_port=data.get("tcp_port", AppSettings.tcp_port),
+        db=data.get("db", AppSettings.db),
+        start=data.get("start", AppSettings.start),
+        size=data.get("size", AppSettings.size),
+        interval_ms=data.get("interval_ms", AppSettings.interval_ms),
     )
 
 
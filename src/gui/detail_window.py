@@ -3,10 +3,21 @@ from __future__ import annotations
 from typing import Callable, Optional, Tuple
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
 
 from plc_client import SAWLOG
 
+from .window_utils import center_over_parent
+
+
+def make_header_font(root: tk.Misc) -> tkfont.Font:
+    """Bold copy of TkDefaultFont, bound to the interpreter of ``root``."""
+
+    header_font = tkfont.nametofont("TkDefaultFont", root=root).copy()
+    header_font.configure(weight="bold")
+    return header_font
+
 
 class DetailWindow:
     """Modal details window for a single SAWLOG with navigation.
@@ -21,20 +32,20 @@ class DetailWindow:
         start_index: int = 0,
         send_callback: Callable[[int, SAWLOG], None] | None = None,
         notice_callback: Callable[[str, bool], None] | None = None,
+        header_font: tkfont.Font | None = None,
     ) -> None:
         self._root = root
+        # Bold table-header font; the app passes one per root so windows share it
+        self._header_font = header_font
         self._data_provider = data_provider
         self._send_cb = send_callback
         self._notice_cb = notice_callback
         self._win: Optional[tk.Toplevel] = None
         self._content: Optional[ttk.Frame] = None
         self._index_var: Optional[tk.StringVar] = None
-        self._header_font = None
         self._current_index = start_index
-        # Cached widgets to avoid rebuild flicker
-        self._header_value_labels: list[tk.Label] = []
-        self._flags_cells: list[tk.Label] = []  # 32 cells (hidden in view/edit unified mode)
-        self._buttons_cells: list[tk.Label] = []  # 64 cells (hidden in view/edit unified mode)
+        # Widgets are built once per window to avoid rebuild flicker
+        self._built = False
         # Unified editors used for both view/edit (disabled in view mode)
         self._header_edit_entries: list[tk.Entry] = []
         self._flag_check_vars: list[tk.BooleanVar] = []
@@ -146,26 +157,11 @@ class DetailWindow:
         self._render(self._current_index)
         # Center window over parent
         try:
-            self._center_over_parent()
+            center_over_parent(win, self._root)
         except Exception:
             pass
         win.focus_set()
 
-    def _center_over_parent(self) -> None:
-        if self._win is None:
-            return
-        parent = self._root
-        self._win.update_idletasks()
-        pw = parent.winfo_width() or parent.winfo_reqwidth()
-        ph = parent.winfo_height() or parent.winfo_reqheight()
-        px = parent.winfo_rootx()
-        py = parent.winfo_rooty()
-        ww = self._win.winfo_width()
-        wh = self._win.winfo_height()
-        x = px + max(0, (pw - ww) // 2)
-        y = py + max(0, (ph - wh) // 2)
-        self._win.geometry(f"+{x}+{y}")
-
     def _render(self, index: int, *, force: bool = False) -> None:
         if self._content is None or self._win is None:
             return
@@ -197,7 +193,7 @@ class DetailWindow:
             record.length,
             record.position,
             record.drop_box_number,
-            record.timestamp.to_datetime().isoformat(sep=" "),
+            record.iso_timestamp,
         ]
         for ent, val in zip(self._header_edit_entries, values):
             try:
@@ -213,7 +209,7 @@ class DetailWindow:
         # Update flags (checkbox variables)
         for i in range(32):
             try:
-                self._flag_check_vars[i].set(bool(record.flags[i]))
+                self._flag_check_vars[i].set(record.flag(i))
             except Exception:
                 pass
 
@@ -251,15 +247,20 @@ class DetailWindow:
     def _ensure_built(self) -> None:
         if self._content is None or self._win is None:
             return
-        if self._header_value_labels and self._flags_cells and self._buttons_cells:
+        if self._built:
             return
+        # Start clean in case an earlier build failed part-way
+        for child in self._content.winfo_children():
+            child.destroy()
+        self._header_edit_entries = []
+        self._flag_check_vars = []
+        self._flag_checkbuttons = []
+        self._button_edit_entries = []
 
         # Fonts for table headers
         if self._header_font is None:
-            import tkinter.font as tkfont
-            base = tkfont.nametofont("TkDefaultFont")
-            self._header_font = base.copy()
-            self._header_font.configure(weight="bold")
+            self._header_font = make_header_font(self._root)
+        header_font = self._header_font
 
         def add_cell(parent, text, row, col, *, header=False, width=3) -> tk.Label:
             bg = "#e8eefc" if header else None
@@ -274,7 +275,7 @@ class DetailWindow:
                 bg=bg,
             )
             if header:
-                lbl.configure(font=self._header_font)
+                lbl.configure(font=header_font)
             lbl.grid(row=row, column=col, sticky="nsew")
             return lbl
 
@@ -284,11 +285,6 @@ class DetailWindow:
         header_labels = ["ID", "Zone", "Sensor", "Length", "Position", "DropBox", "Timestamp"]
         for r, label in enumerate(header_labels):
             ttk.Label(header_frame, text=f"{label}:").grid(row=r, column=0, sticky="w", padx=6, pady=2)
-            # Keep label element for legacy but hide it; use entry for both view/edit
-            val_label = tk.Label(header_frame, text="", anchor="w")
-            val_label.grid(row=r, column=1, sticky="w", padx=6, pady=2)
-            val_label.grid_remove()
-            self._header_value_labels.append(val_label)
             # Unified entry (disabled in view mode)
             e = tk.Entry(header_frame)
             e.grid(row=r, column=1, sticky="ew", padx=6, pady=2)
@@ -305,10 +301,6 @@ class DetailWindow:
         for r in range(4):
             add_cell(flags_frame, r * 8, r + 1, 0, header=True, width=3)
             for c in range(8):
-                # Keep legacy cell hidden; use checkbox for view/edit
-                cell = add_cell(flags_frame, "", r + 1, c + 1, width=3)
-                cell.grid_remove()
-                self._flags_cells.append(cell)
                 var = tk.BooleanVar(value=False)
                 chk = tk.Checkbutton(flags_frame, variable=var, text="", width=2)
                 chk.grid(row=r + 1, column=c + 1)
@@ -330,7 +322,6 @@ class DetailWindow:
             add_cell(buttons_frame, c, 0, c + 1, header=True, width=4)
         # Build cells: 4 button-rows; each grid row contains 8 columns, each a small frame with two entries
         # Keep internal list ordering as first all orders[0..31], then all counts[0..31]
-        per_button_frames: list[tk.Frame] = []
         # First pass: create frames and order fields
         orders_list: list[tk.Entry] = []
         counts_list: list[tk.Entry] = []
@@ -338,14 +329,8 @@ class DetailWindow:
             row_label = r_block * 8
             add_cell(buttons_frame, row_label, r_block + 1, 0, header=True, width=4)
             for c in range(8):
-                idx = r_block * 8 + c
-                # Hidden placeholder to satisfy legacy structure check
-                placeholder = add_cell(buttons_frame, "", r_block + 1, c + 1, width=4)
-                placeholder.grid_remove()
-                self._buttons_cells.append(placeholder)
                 cell = tk.Frame(buttons_frame)
                 cell.grid(row=r_block + 1, column=c + 1, sticky="nsew")
-                per_button_frames.append(cell)
                 ent_ord = tk.Entry(cell, width=4)
                 ent_ord.pack(side="left")
                 ent_ord.configure(state="disabled")
@@ -367,6 +352,7 @@ class DetailWindow:
         self._content.columnconfigure(0, weight=1)
         self._content.columnconfigure(1, weight=1)
         self._content.rowconfigure(1, weight=1)
+        self._built = True
 
     def _toggle_edit(self) -> None:
         self._ensure_built()
@@ -1,16 +1,71 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from plc_client import PLCClient, PLCConfig, SAWLOG
-from plc_client.readers import fetch_payload_and_records
-from .detail_window import DetailWindow
+from plc_client import PLCClient, PLCConfig, SAWLOG, SawlogsRegisterDB
+from plc_client.readers import ParsedPayloadCache, fetch_payload_and_records
+from .detail_window import DetailWindow, make_header_font
 from .settings_window import SettingsWindow
-from .app_settings import AppSettings, load_settings
+from .app_settings import AppSettings, coerce_settings, load_settings
+
+_OVERVIEW_COLUMNS = (
+    "Index",
+    "ID",
+    "Zone",
+    "Sensor",
+    "Length",
+    "Position",
+    "DropBox",
+    "Flags",
+    "Buttons",
+    "Timestamp",
+)
+_SAWLOG_BYTES = SAWLOG.BYTE_SIZE
+_SAWLOG_LEGACY_BYTES = SAWLOG.LEGACY_BYTE_SIZE
+_REGISTER_BYTES = SawlogsRegisterDB.DB_BYTE_SIZE
+# Extra rows rendered above/below the viewport so short scrolls show filled rows
+_OVERSCAN_ROWS = 10
+# One byte of flags -> its 8 glyphs (bit0 first); full block for True, light shade for False
+_FLAG_GLYPHS_8 = tuple(
+    " ".join("█" if byte & (1 << bit) else "░" for bit in range(8)) for byte in range(256)
+)
+
+
+def _overview_row_values(index: int, record: SAWLOG) -> tuple:
+    """Format one SAWLOG as the value tuple for an Overview table row."""
+    # Render flags with spaces; 4 groups of 8, one table lookup per group
+    word = record.flags
+    flags_boxes = "  ".join(_FLAG_GLYPHS_8[(word >> shift) & 0xFF] for shift in (0, 8, 16, 24))
+    # Show 32 buttons as "order:count" pairs (decimal), new layout first 32 then 32
+    try:
+        orders = record.buttons[:32]
+        counts = record.buttons[32:64]
+        buttons_full = " ".join(
+            f"{int(orders[i])}:{int(counts[i])}" for i in range(32)
+        )
+    except Exception:
+        buttons_full = ""
+    # Unused or foreign slots can hold DTL values datetime rejects (e.g. year 0)
+    try:
+        timestamp = record.iso_timestamp
+    except (ValueError, OverflowError):
+        timestamp = "<invalid DTL>"
+    return (
+        index,
+        record.id,
+        record.zone_id,
+        record.sensor_id,
+        record.length,
+        record.position,
+        record.drop_box_number,
+        flags_boxes,
+        buttons_full,
+        timestamp,
+    )
 
 
 class PLCReaderApp:
@@ -28,18 +83,36 @@ class PLCReaderApp:
         self.slot_var = tk.StringVar(value=str(self._settings.slot))
         self.tcp_port_var = tk.StringVar(value=str(self._settings.tcp_port))
         self.status_var = tk.StringVar(value="Unknown")
+        # Fonts belong to this root's interpreter, so the shared one is kept per app
+        self._header_font = make_header_font(self.root)
 
         self._is_busy = False
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Connection opened by the reader loop; published here only while connected and
+        # shared with sends. snap7 clients are not thread-safe, so I/O on the published
+        # client goes through the lock (connect/disconnect happen while unpublished).
         self._client: Optional[PLCClient] = None
+        self._client_lock = threading.Lock()
+        # Set once the window is being torn down; worker threads stop posting to Tk
+        self._closing = False
         self._input_widgets: list[tk.Widget] = []
         self._records_cache: Tuple[SAWLOG, ...] | None = None
+        # Overview rows are filled lazily: formatted values per index (None until
+        # first shown) and the indices whose tree cells are out of date.
+        self._overview_rows: list[Optional[tuple]] = []
+        self._stale_rows: set[int] = set()
+        self._refresh_pending = False
+        # Values last written to the tree, per row index; later reads diff against it
+        self._rendered_cache: dict[int, tuple] = {}
+        # Records object currently shown in the table (identity check skips no-op refreshes)
+        self._rendered_records: Tuple[SAWLOG, ...] | None = None
         self._detail_window: Optional[DetailWindow] = None
         self._pending_start: Optional[tuple] = None  # holds args for _start_reader on restart
 
         self._build_ui()
         self._set_initial_geometry()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # -- UI build ---------------------------------------------------------------
     def _build_ui(self) -> None:
@@ -54,7 +127,7 @@ class PLCReaderApp:
         file_menu.add_command(label="Connect", command=self.on_connect_toggle)
         file_menu.add_command(label="Settings...", command=self._open_settings)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.destroy)
+        file_menu.add_command(label="Exit", command=self._on_close)
         menubar.add_cascade(label="File", menu=file_menu)
 
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -131,15 +204,15 @@ class PLCReaderApp:
                 pass
             self._settings_win = None
 
-        current = AppSettings(
-            address=self.address_var.get().strip(),
-            rack=int(self.rack_var.get()),
-            slot=int(self.slot_var.get()),
-            tcp_port=int(self.tcp_port_var.get()),
-            db=int(self.db_var.get()),
-            start=int(self.start_var.get()),
-            size=int(self.size_var.get()),
-            interval_ms=int(self.interval_var.get()),
+        current = coerce_settings(
+            address=self.address_var.get(),
+            rack=self.rack_var.get(),
+            slot=self.slot_var.get(),
+            tcp_port=self.tcp_port_var.get(),
+            db=self.db_var.get(),
+            start=self.start_var.get(),
+            size=self.size_var.get(),
+            interval_ms=self.interval_var.get(),
         )
 
         def apply_cb(new_settings: AppSettings, saved: bool) -> None:
@@ -167,18 +240,7 @@ class PLCReaderApp:
         self._settings_win = SettingsWindow(self.root, current, apply_cb)
 
     def _build_overview_table(self, parent) -> None:
-        columns = (
-            "Index",
-            "ID",
-            "Zone",
-            "Sensor",
-            "Length",
-            "Position",
-            "DropBox",
-            "Flags",
-            "Buttons",
-            "Timestamp",
-        )
+        columns = _OVERVIEW_COLUMNS
         container = ttk.Frame(parent)
         container.pack(fill="both", expand=True)
 
@@ -198,7 +260,10 @@ class PLCReaderApp:
             pass
         vsb = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(container, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self._overview_vsb = vsb
+        # Any vertical scroll (scrollbar, wheel, keys) reports here; fill newly visible rows
+        self.tree.configure(yscrollcommand=self._on_overview_yscroll, xscrollcommand=hsb.set)
+        self.tree.bind("<Configure>", lambda _e: self._refresh_visible_rows(), add="+")
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -244,33 +309,36 @@ class PLCReaderApp:
             return
 
         try:
-            db = int(self.db_var.get())
-            start = int(self.start_var.get())
-            size = int(self.size_var.get())
-            interval_ms = int(self.interval_var.get())
-            rack = int(self.rack_var.get())
-            slot = int(self.slot_var.get())
-            tcp_port = int(self.tcp_port_var.get())
-        except ValueError:
+            settings = coerce_settings(
+                address=self.address_var.get(),
+                rack=self.rack_var.get(),
+                slot=self.slot_var.get(),
+                tcp_port=self.tcp_port_var.get(),
+                db=self.db_var.get(),
+                start=self.start_var.get(),
+                size=self.size_var.get(),
+                interval_ms=self.interval_var.get(),
+            )
+        except ValueError as exc:
             messagebox.showerror(
                 "Invalid input",
-                "DB, start, size, interval, rack, slot, and TCP port must be numbers.",
+                f"DB, start, size, interval, rack, slot, and TCP port must be numbers.\n{exc}",
                 parent=self.root,
             )
             return
 
         try:
             config = PLCConfig(
-                address=self.address_var.get().strip(),
-                rack=rack,
-                slot=slot,
-                tcp_port=tcp_port,
+                address=settings.address,
+                rack=settings.rack,
+                slot=settings.slot,
+                tcp_port=settings.tcp_port,
             )
         except ValueError as exc:
             messagebox.showerror("Invalid configuration", str(exc), parent=self.root)
             return
 
-        self._start_reader(config, db, start, size, interval_ms)
+        self._start_reader(config, settings.db, settings.start, settings.size, settings.interval_ms)
 
     def _start_reader(self, config: PLCConfig, db: int, start: int, size: int, interval_ms: int) -> None:
         if self._reader_thread and self._reader_thread.is_alive():
@@ -290,31 +358,40 @@ class PLCReaderApp:
             import time as _time
             backoff = 1.0
             client = PLCClient(config)
+            # Unchanged polls return the same records object; reuse the parse and rows
+            cache = ParsedPayloadCache()
+            last_records = None
+            rows = None
             try:
                 while not self._stop_event.is_set():
                     try:
                         if not client.is_connected:
+                            # Not published yet, so no lock: a slow connect never blocks sends
                             client.connect()
+                            with self._client_lock:
+                                self._client = client
                             self._post_online(True)
                             self._console_log(f"Connected to {config.address}:{config.tcp_port}")
                             backoff = 1.0
-                        payload, records = fetch_payload_and_records(client, db, start, size)
+                        if self._stop_event.is_set():
+                            break
+                        with self._client_lock:
+                            payload, records = fetch_payload_and_records(
+                                client, db, start, size, cache=cache
+                            )
                         self._console_log(f"Read {len(payload)} byte(s) from DB{db} @ {start}")
                         if records is None:
-                            try:
-                                from plc_client import SAWLOG as _SAWLOG, SawlogsRegisterDB as _SRDB
-                                legacy = getattr(_SAWLOG, 'LEGACY_BYTE_SIZE', 88)
-                                if size != _SRDB.DB_BYTE_SIZE and ((len(payload) % _SAWLOG.BYTE_SIZE) != 0 and (len(payload) % legacy) != 0):
-                                    self._console_log(
-                                        f"Note: Size {size} is not full register ({_SRDB.DB_BYTE_SIZE}) and not a multiple of SAWLOG sizes (94 or 88); cannot parse table."
-                                    )
-                            except Exception:
-                                pass
-                        self._post_result_with_records("", records, success=True)
+                            n = len(payload)
+                            if size != _REGISTER_BYTES and n % _SAWLOG_BYTES and n % _SAWLOG_LEGACY_BYTES:
+                                self._console_log(
+                                    f"Note: Size {size} is not full register ({_REGISTER_BYTES}) and not a multiple of SAWLOG sizes ({_SAWLOG_BYTES} or {_SAWLOG_LEGACY_BYTES}); cannot parse table."
+                                )
                     except Exception as exc:
                         # Unexpected disconnect: mark offline but keep last data in table
                         self._post_handle_disconnect(clear_table=False)
                         self._console_log(f"Connection error: {exc}. Retrying...")
+                        with self._client_lock:
+                            self._client = None
                         try:
                             client.disconnect()
                         except Exception:
@@ -322,21 +399,36 @@ class PLCReaderApp:
                         _time.sleep(min(backoff, 5.0))
                         backoff = min(backoff * 2.0, 5.0)
                         continue
+                    # Format table rows here, off the Tk thread; the UI only inserts them.
+                    # Bad data is not a connection problem, so it must not drop the link.
+                    if records is not last_records:
+                        try:
+                            rows = (
+                                tuple(_overview_row_values(i, r) for i, r in enumerate(records))
+                                if records
+                                else None
+                            )
+                        except Exception as exc:
+                            self._console_log(f"Format error: {exc}")
+                            rows = None
+                        last_records = records
+                    self._post_result_with_records("", records, rows=rows, success=True)
                     delay = max(0, interval_ms) / 1000.0
                     for _ in range(max(1, int(delay * 10))):
                         if self._stop_event.is_set():
                             break
                         _time.sleep(0.1)
             finally:
+                with self._client_lock:
+                    self._client = None
                 try:
-                    if client.is_connected:
-                        client.disconnect()
+                    client.disconnect()
                 except Exception:
                     pass
                 # On final disconnect, clear table only if not immediately restarting
                 self._post_handle_disconnect(clear_table=(self._pending_start is None))
                 self._console_log("Disconnected")
-                self.root.after(0, self._reset_controls_after_disconnect)
+                self._post(0, self._reset_controls_after_disconnect)
 
         self._reader_thread = threading.Thread(target=loop, daemon=True)
         self._reader_thread.start()
@@ -361,15 +453,26 @@ class PLCReaderApp:
 
     # -- UI updates -------------------------------------------------------------
     def _post_result_with_records(
-        self, message: str, records: Tuple[SAWLOG, ...] | None, *, success: bool
+        self,
+        message: str,
+        records: Tuple[SAWLOG, ...] | None,
+        *,
+        rows: Tuple[tuple, ...] | None = None,
+        success: bool,
     ) -> None:
-        self.root.after(0, lambda: self._update_ui_after_result_with_records(message, records, success))
+        self._post(
+            0, lambda: self._update_ui_after_result_with_records(message, records, success, rows)
+        )
 
     def _update_ui_after_result_with_records(
-        self, message: str, records: Tuple[SAWLOG, ...] | None, success: bool
+        self,
+        message: str,
+        records: Tuple[SAWLOG, ...] | None,
+        success: bool,
+        rows: Tuple[tuple, ...] | None = None,
     ) -> None:
         self._set_busy(False)
-        self._populate_overview(records)
+        self._populate_overview(records, rows)
         # Also refresh details window if open
         if self._detail_window is not None:
             try:
@@ -398,14 +501,14 @@ class PLCReaderApp:
         self._apply_status_state("Online" if online else "Offline")
 
     def _post_online(self, online: bool) -> None:
-        self.root.after(0, lambda: self._set_online(online))
+        self._post(0, lambda: self._set_online(online))
 
     def _post_handle_disconnect(self, *, clear_table: bool) -> None:
         def task() -> None:
             self._set_online(False)
             if clear_table:
                 self._clear_overview_rows()
-        self.root.after(0, task)
+        self._post(0, task)
 
     def _schedule_restart_with(self, settings: AppSettings) -> None:
         # If reader is running, schedule a restart with new settings
@@ -433,7 +536,7 @@ class PLCReaderApp:
             self.result_box.insert("end", entry)
             self.result_box.see("end")
             self.result_box.configure(state="disabled")
-        self.root.after(0, append)
+        self._post(0, append)
 
     def _post_notice(self, message: str, success: bool, *, duration_ms: int = 3000) -> None:
         prev = self.status_var.get()
@@ -450,8 +553,8 @@ class PLCReaderApp:
                 self.status_text.configure(text=self.status_var.get())
             except Exception:
                 pass
-        self.root.after(0, set_msg)
-        self.root.after(duration_ms, restore)
+        self._post(0, set_msg)
+        self._post(duration_ms, restore)
 
 
     def _set_controls_enabled(self, enabled: bool) -> None:
@@ -467,12 +570,74 @@ class PLCReaderApp:
             return
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self._overview_rows = []
+        self._stale_rows = set()
+        self._rendered_cache = {}
+        self._rendered_records = None
 
     # -- Overview / details -----------------------------------------------------
-    def _populate_overview(self, records: Tuple[SAWLOG, ...] | None) -> None:
+    def _populate_overview(
+        self, records: Tuple[SAWLOG, ...] | None, rows: Tuple[tuple, ...] | None = None
+    ) -> None:
         if not hasattr(self, "tree"):
             return
+        if records and records is self._rendered_records:
+            # Same parse result as last time (payload unchanged): nothing to redraw
+            return
+        if records and self._rendered_cache and len(records) == len(self._overview_rows):
+            # Same row count as what is shown: patch only the cells that changed
+            self._records_cache = tuple(records)
+            self._update_overview(self._diff_overview(records, rows))
+            self._rendered_records = records
+            return
+        self._reset_overview(records, rows)
+
+    def _diff_overview(
+        self, records: Tuple[SAWLOG, ...], rows: Tuple[tuple, ...] | None
+    ) -> list[tuple[int, dict[str, object]]]:
+        """Adopt the new rows and return (index, {column: value}) for shown cells that changed.
+
+        Rows never shown stay lazy: they are only marked stale, not formatted here.
+        """
+        count = len(records)
+        new_rows = list(rows) if rows is not None and len(rows) == count else [None] * count
+        rendered = self._rendered_cache
+        diff = []
+        for index in range(count):
+            old = rendered.get(index)
+            if old is None:
+                self._stale_rows.add(index)
+                continue
+            new = new_rows[index]
+            if new is None:
+                new = new_rows[index] = _overview_row_values(index, records[index])
+            if new != old:
+                diff.append(
+                    (index, {col: v for col, o, v in zip(_OVERVIEW_COLUMNS, old, new) if o != v})
+                )
+        self._overview_rows = new_rows
+        return diff
+
+    def _update_overview(self, diff: Iterable[tuple[int, dict[str, object]]]) -> None:
+        """Write changed cells with tree.set; rows and their order are left untouched."""
+        changed = False
+        for index, cells in diff:
+            iid = str(index)
+            for col, value in cells.items():
+                self.tree.set(iid, column=col, value=value)
+            self._rendered_cache[index] = self._overview_rows[index]
+            changed = True
+        self._refresh_visible_rows()
+        if changed:
+            try:
+                self._autosize_columns()
+            except Exception:
+                pass
 
+    def _reset_overview(
+        self, records: Tuple[SAWLOG, ...] | None, rows: Tuple[tuple, ...] | None = None
+    ) -> None:
+        """Rebuild the table for a new record set (first read or a changed row count)."""
         # Remember current selection (by iid/index) and scroll offsets to restore after refresh
         try:
             current_sel = self.tree.selection()
@@ -490,55 +655,36 @@ class PLCReaderApp:
             x0 = 0.0
             y0 = 0.0
 
-        # Rebuild rows
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         self._records_cache = tuple(records) if records else None
         if not records:
+            self._clear_overview_rows()
             return
-        for index, record in enumerate(records):
-            # Render flags with spaces; 4 groups of 8
-            # Use full block for True (█) and light shade for False (░)
-            _flag_glyphs = ["█" if flag else "░" for flag in record.flags]
-            if len(_flag_glyphs) >= 32:
-                flags_boxes = (
-                    " ".join(_flag_glyphs[:8])
-                    + "  "
-                    + " ".join(_flag_glyphs[8:16])
-                    + "  "
-                    + " ".join(_flag_glyphs[16:24])
-                    + "  "
-                    + " ".join(_flag_glyphs[24:32])
-                )
-            else:
-                flags_boxes = " ".join(_flag_glyphs)
-            # Show 32 buttons as "order:count" pairs (decimal), new layout first 32 then 32
+
+        # Keep one (placeholder) row per record so scrolling and selection behave as
+        # usual; cell values are only formatted/filled for rows near the viewport.
+        count = len(records)
+        existing = len(self.tree.get_children(""))
+        if existing > count:
+            self.tree.delete(*(str(i) for i in range(count, existing)))
+        if count > existing:
+            # Detach the tree and hide its columns while adding rows so Tk does not
+            # re-layout cells per insert; everything is laid out once on re-attach.
+            self.tree.grid_remove()
+            self.tree.configure(displaycolumns=())
             try:
-                orders = record.buttons[:32]
-                counts = record.buttons[32:64]
-                buttons_full = " ".join(
-                    f"{int(orders[i])}:{int(counts[i])}" for i in range(32)
-                )
-            except Exception:
-                buttons_full = ""
-            timestamp = record.timestamp.to_datetime().isoformat(sep=" ")
-            self.tree.insert(
-                "",
-                "end",
-                iid=str(index),
-                values=(
-                    index,
-                    record.id,
-                    record.zone_id,
-                    record.sensor_id,
-                    record.length,
-                    record.position,
-                    record.drop_box_number,
-                    flags_boxes,
-                    buttons_full,
-                    timestamp,
-                ),
-            )
+                for index in range(existing, count):
+                    self.tree.insert("", "end", iid=str(index), values=(index,))
+            finally:
+                self.tree.configure(displaycolumns="#all")
+                self.tree.grid()
+        # Use rows pre-formatted by the reader thread when available
+        if rows is not None and len(rows) == count:
+            self._overview_rows = list(rows)
+        else:
+            self._overview_rows = [None] * count
+        self._stale_rows = set(range(count))
+        self._rendered_cache = {}
+        self._rendered_records = records
 
         # Restore selection and focus if possible
         try:
@@ -553,18 +699,50 @@ class PLCReaderApp:
         except Exception:
             pass
 
+        # Restore scroll positions (horizontal and vertical)
+        try:
+            self.tree.xview_moveto(x0)
+            self.tree.yview_moveto(y0)
+        except Exception:
+            pass
+
+        self._refresh_visible_rows()
+
         # Adjust columns to fit content for Flags and Buttons
         try:
             self._autosize_columns()
         except Exception:
             pass
 
-        # Restore scroll positions (horizontal and vertical)
+    def _on_overview_yscroll(self, first, last) -> None:
+        self._overview_vsb.set(first, last)
+        if self._stale_rows and not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._refresh_visible_rows)
+
+    def _refresh_visible_rows(self) -> None:
+        """Fill in cell values for the rows currently in (or near) the viewport."""
+        self._refresh_pending = False
+        records = self._records_cache
+        if not records or not self._stale_rows:
+            return
+        count = len(records)
         try:
-            self.tree.xview_moveto(x0)
-            self.tree.yview_moveto(y0)
+            first, last = self.tree.yview()
         except Exception:
-            pass
+            first, last = 0.0, 1.0
+        lo = max(0, int(first * count) - _OVERSCAN_ROWS)
+        hi = min(count, int(last * count + 0.999) + _OVERSCAN_ROWS)
+        for index in range(lo, hi):
+            if index not in self._stale_rows:
+                continue
+            values = self._overview_rows[index]
+            if values is None:
+                values = _overview_row_values(index, records[index])
+                self._overview_rows[index] = values
+            self.tree.item(str(index), values=values)
+            self._rendered_cache[index] = values
+            self._stale_rows.discard(index)
 
     def _autosize_columns(self) -> None:
         import tkinter.font as tkfont
@@ -575,16 +753,16 @@ class PLCReaderApp:
         padding = 24
         # Map column -> max width limits (pixels)
         max_limits = {"Flags": 400, "Buttons": 1200}
+        # Measure formatted rows only; placeholders have not been rendered yet
+        rows = [values for values in self._overview_rows if values is not None]
         for col in ("Flags", "Buttons"):
             # header width
             header_text = col
             max_w = font.measure(header_text)
             # content width
-            for iid in self.tree.get_children(""):
-                try:
-                    value = str(self.tree.set(iid, col))
-                except Exception:
-                    value = ""
+            pos = _OVERVIEW_COLUMNS.index(col)
+            for values in rows:
+                value = str(values[pos])
                 if value:
                     w = font.measure(value)
                     if w > max_w:
@@ -615,6 +793,7 @@ class PLCReaderApp:
                 start_index=index,
                 send_callback=self._send_record_to_plc,
                 notice_callback=self._post_notice,
+                header_font=self._header_font,
             )
             self._detail_window.focus()
 
@@ -634,17 +813,47 @@ class PLCReaderApp:
                 return
             config = PLCConfig(address=address, rack=rack, slot=slot, tcp_port=tcp_port)
             try:
-                with PLCClient(config) as client:
-                    client.write_sawlog_record(db, index, record, start=start)
+                sent = False
+                with self._client_lock:
+                    shared = self._client
+                    if shared is not None and shared.is_connected and shared.config == config:
+                        # Reuse the reader's open connection; no new TCP/S7 handshake
+                        shared.write_sawlog_record(db, index, record, start=start)
+                        sent = True
+                if not sent:
+                    # One-off connection of our own; nothing shared, so no lock
+                    with PLCClient(config) as client:
+                        client.write_sawlog_record(db, index, record, start=start)
                 self._console_log(f"Sent record {index} to DB{db} @ {start + index * record.BYTE_SIZE}")
             except Exception as exc:
                 self._console_log(f"Send failed: {exc}")
 
         threading.Thread(target=worker, daemon=True).start()
 
+    # -- shutdown ---------------------------------------------------------------
+    def _on_close(self) -> None:
+        # The reader's finally block disconnects; never wait on the client lock here
+        self._closing = True
+        self._stop_event.set()
+        self.root.destroy()
+
+    def _post(self, delay_ms: int, callback) -> None:
+        """Schedule ``callback`` on the Tk thread; a no-op once the window is gone."""
+        if self._closing:
+            return
+        try:
+            self.root.after(delay_ms, callback)
+        except (tk.TclError, RuntimeError):
+            # Destroyed between the check and the call (or mainloop already exited)
+            pass
+
     # -- entrypoint -------------------------------------------------------------
     def run(self) -> None:
         self.root.mainloop()
+        # Give the reader a moment to leave its loop and disconnect (daemon thread)
+        reader = self._reader_thread
+        if reader is not None and reader.is_alive():
+            reader.join(timeout=2.0)
 
 
 
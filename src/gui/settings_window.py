@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Callable, Optional
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from .app_settings import AppSettings, save_settings
+from .app_settings import AppSettings, coerce_settings, save_settings
+from .window_utils import center_over_parent
 
 
 class SettingsWindow:
@@ -24,6 +26,7 @@ class SettingsWindow:
         self._win: Optional[tk.Toplevel] = None
         self._apply_cb = apply_callback
         self._initial = initial
+        self._vars: dict[str, tk.StringVar] = {}
         self._build()
 
     def _build(self) -> None:
@@ -50,15 +53,10 @@ class SettingsWindow:
         container.columnconfigure(1, weight=1)
         container.rowconfigure(0, weight=1)
 
-        # Variables
-        self.address_var = tk.StringVar(value=self._initial.address)
-        self.rack_var = tk.StringVar(value=str(self._initial.rack))
-        self.slot_var = tk.StringVar(value=str(self._initial.slot))
-        self.tcp_port_var = tk.StringVar(value=str(self._initial.tcp_port))
-        self.db_var = tk.StringVar(value=str(self._initial.db))
-        self.start_var = tk.StringVar(value=str(self._initial.start))
-        self.size_var = tk.StringVar(value=str(self._initial.size))
-        self.interval_var = tk.StringVar(value=str(self._initial.interval_ms))
+        # Variables, keyed by AppSettings field name
+        self._vars = {
+            name: tk.StringVar(value=str(value)) for name, value in asdict(self._initial).items()
+        }
 
         # Left tree navigation
         tree_frame = ttk.Frame(container)
@@ -84,10 +82,10 @@ class SettingsWindow:
 
         # PLC fields
         plc_rows = [
-            ("IP Address", self.address_var),
-            ("Rack", self.rack_var),
-            ("Slot", self.slot_var),
-            ("TCP Port", self.tcp_port_var),
+            ("IP Address", self._vars["address"]),
+            ("Rack", self._vars["rack"]),
+            ("Slot", self._vars["slot"]),
+            ("TCP Port", self._vars["tcp_port"]),
         ]
         for i, (label, var) in enumerate(plc_rows):
             ttk.Label(plc_tab, text=label).grid(row=i, column=0, sticky="w", pady=4, padx=(4, 8))
@@ -96,10 +94,10 @@ class SettingsWindow:
 
         # DB fields
         db_rows = [
-            ("DB", self.db_var),
-            ("Start Offset", self.start_var),
-            ("Size (bytes)", self.size_var),
-            ("Interval (ms)", self.interval_var),
+            ("DB", self._vars["db"]),
+            ("Start Offset", self._vars["start"]),
+            ("Size (bytes)", self._vars["size"]),
+            ("Interval (ms)", self._vars["interval_ms"]),
         ]
         for i, (label, var) in enumerate(db_rows):
             ttk.Label(db_tab, text=label).grid(row=i, column=0, sticky="w", pady=4, padx=(4, 8))
@@ -128,26 +126,17 @@ class SettingsWindow:
 
         # Center window over parent
         try:
-            self._center_over_parent()
+            center_over_parent(win, self._root)
         except Exception:
             pass
 
     def _read_settings(self) -> AppSettings:
         try:
-            return AppSettings(
-                address=self.address_var.get().strip(),
-                rack=int(self.rack_var.get()),
-                slot=int(self.slot_var.get()),
-                tcp_port=int(self.tcp_port_var.get()),
-                db=int(self.db_var.get()),
-                start=int(self.start_var.get()),
-                size=int(self.size_var.get()),
-                interval_ms=int(self.interval_var.get()),
-            )
-        except ValueError:
+            return coerce_settings(**{name: var.get() for name, var in self._vars.items()})
+        except ValueError as exc:
             messagebox.showerror(
                 "Invalid settings",
-                "Rack, Slot, TCP Port, DB, Start, Size, and Interval must be integers.",
+                f"Rack, Slot, TCP Port, DB, Start, Size, and Interval must be integers.\n{exc}",
                 parent=self._win,
             )
             raise
@@ -186,18 +175,3 @@ class SettingsWindow:
             except Exception:
                 pass
             self._win = None
-
-    def _center_over_parent(self) -> None:
-        if self._win is None:
-            return
-        parent = self._root
-        self._win.update_idletasks()
-        pw = parent.winfo_width() or parent.winfo_reqwidth()
-        ph = parent.winfo_height() or parent.winfo_reqheight()
-        px = parent.winfo_rootx()
-        py = parent.winfo_rooty()
-        ww = self._win.winfo_width()
-        wh = self._win.winfo_height()
-        x = px + max(0, (pw - ww) // 2)
-        y = py + max(0, (ph - wh) // 2)
-        self._win.geometry(f"+{x}+{y}")
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import re
+import tkinter as tk
+
+_GEOMETRY_SIZE = re.compile(r"^(\d+)x(\d+)")
+
+
+def center_over_parent(win: tk.Toplevel, parent: tk.Misc) -> None:
+    """Center ``win`` over ``parent`` by moving it; the window is never withdrawn."""
+
+    win.update_idletasks()
+    # wm geometry reflects a size forced with geometry("WxH") even before the window
+    # is mapped; fall back to the requested size while it still reports 1x1
+    match = _GEOMETRY_SIZE.match(win.wm_geometry())
+    ww, wh = (int(match.group(1)), int(match.group(2))) if match else (1, 1)
+    if ww <= 1 or wh <= 1:
+        ww, wh = win.winfo_reqwidth(), win.winfo_reqheight()
+    pw = parent.winfo_width() or parent.winfo_reqwidth()
+    ph = parent.winfo_height() or parent.winfo_reqheight()
+    x = parent.winfo_rootx() + max(0, (pw - ww) // 2)
+    y = parent.winfo_rooty() + max(0, (ph - wh) // 2)
+    win.geometry(f"+{x}+{y}")
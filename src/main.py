@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import argparse
 import sys
-from typing import Iterable, Sequence, Tuple
+from typing import Iterable, Iterator, Sequence, Tuple
 
+from app_config import coerce_settings
 from plc_client import PLCClient, PLCConfig, SAWLOG, SawlogsRegisterDB
 from plc_client.readers import fetch_payload_and_records
-from gui import PLCReaderApp
 Records = Tuple[SAWLOG, ...]
 MAX_PREVIEW_BYTES = 32
 
+# Layout sizes are fixed; bind once instead of walking class attributes per call.
+_SAWLOG_BYTES = SAWLOG.BYTE_SIZE
+_SAWLOG_LEGACY_BYTES = SAWLOG.LEGACY_BYTE_SIZE
+_REG_CAPACITY = SawlogsRegisterDB.CAPACITY
+_REGISTER_BYTES = SawlogsRegisterDB.DB_BYTE_SIZE
+
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Read bytes from a Siemens PLC")
@@ -31,11 +37,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def summarise_sawlogs(records: Iterable[SAWLOG]) -> Tuple[str, ...]:
-    lines = []
+def iter_sawlog_lines(records: Iterable[SAWLOG]) -> Iterator[str]:
     for index, record in enumerate(records):
-        timestamp = record.timestamp.to_datetime().isoformat(sep=" ")
-        flags = "".join("1" if flag else "0" for flag in record.flags)
+        # FL0 first: reverse the zero-padded binary of the packed flag word
+        flags = format(record.flags, "032b")[::-1]
         # Show first 5 buttons as order,count pairs; new layout is first 32 then 32
         try:
             orders = record.buttons[:32]
@@ -45,82 +50,108 @@ def summarise_sawlogs(records: Iterable[SAWLOG]) -> Tuple[str, ...]:
             buttons_preview += " ..."
         except Exception:
             buttons_preview = ""
-        lines.append(
+        yield (
             f"[{index:03}] id={record.id} zone={record.zone_id} sensor={record.sensor_id} "
             f"length={record.length} position={record.position} drop_box={record.drop_box_number} "
-            f"flags={flags} buttons={buttons_preview} timestamp={timestamp}"
+            f"flags={flags} buttons={buttons_preview} timestamp={record.iso_timestamp}"
         )
-    return tuple(lines)
 
 
-def summarise_payload(
+def summarise_sawlogs(records: Iterable[SAWLOG]) -> Tuple[str, ...]:
+    return tuple(iter_sawlog_lines(records))
+
+
+def iter_summary_lines(
     payload: bytearray,
     db: int,
     start: int,
     *,
     sawlog_records: Records | None = None,
-) -> str:
+) -> Iterator[str]:
     size = len(payload)
-    lines = [f"Read {size} byte(s) from DB{db} @ {start}."]
+    yield f"Read {size} byte(s) from DB{db} @ {start}."
 
     if size == 0:
-        lines.append("Payload is empty.")
-        return "\n".join(lines)
+        yield "Payload is empty."
+        return
 
     preview_len = min(size, MAX_PREVIEW_BYTES)
     preview = payload[:preview_len].hex(" ")
     if size > preview_len:
         preview += " ..."
-    lines.append(f"Hex preview ({preview_len} byte(s)): {preview}")
+    yield f"Hex preview ({preview_len} byte(s)): {preview}"
 
+    rem = size % _SAWLOG_BYTES
+    legacy_rem = size % _SAWLOG_LEGACY_BYTES
     parsed_records: Records | None = sawlog_records
 
-    if parsed_records is None:
-        try:
-            parsed_records = SAWLOG.array_from_bytes_compat(bytes(payload))
-        except ValueError:
-            parsed_records = None
+    if parsed_records is None and (rem == 0 or legacy_rem == 0):
+        # The size check above is exactly what the compat parser validates
+        parsed_records = SAWLOG.array_from_bytes_compat(payload)
 
     if parsed_records:
         count = len(parsed_records)
-        lines.append(f"Parsed {count} SAWLOG record(s).")
+        yield f"Parsed {count} SAWLOG record(s)."
         preview_count = min(count, 5)
-        lines.extend(summarise_sawlogs(parsed_records[:preview_count]))
+        yield from iter_sawlog_lines(parsed_records[:preview_count])
         if count > preview_count:
-            lines.append("...")
+            yield "..."
 
-        if count == SawlogsRegisterDB.CAPACITY:
-            lines.append(
-                f"Interpreted as full SAWLOG register ({SawlogsRegisterDB.CAPACITY} entries, "
-                f"{SawlogsRegisterDB.DB_BYTE_SIZE} bytes)."
+        if count == _REG_CAPACITY:
+            yield (
+                f"Interpreted as full SAWLOG register ({_REG_CAPACITY} entries, "
+                f"{_REGISTER_BYTES} bytes)."
             )
     else:
-        if (size % SAWLOG.BYTE_SIZE != 0) and (size % getattr(SAWLOG, 'LEGACY_BYTE_SIZE', 88) != 0):
-            lines.append(
+        if rem != 0 and legacy_rem != 0:
+            yield (
                 f"Payload length is not a multiple of SAWLOG sizes (94 or 88 bytes); "
                 "skipping structured parse."
             )
 
-    return "\n".join(lines)
+
+def summarise_payload(
+    payload: bytearray,
+    db: int,
+    start: int,
+    *,
+    sawlog_records: Records | None = None,
+) -> str:
+    return "\n".join(
+        iter_summary_lines(payload, db, start, sawlog_records=sawlog_records)
+    )
 
 
 def run_cli(args: argparse.Namespace) -> None:
-    config = PLCConfig(
+    settings = coerce_settings(
         address=args.address,
         rack=args.rack,
         slot=args.slot,
         tcp_port=args.tcp_port,
+        db=args.db,
+        start=args.start,
+        size=args.size,
+    )
+    config = PLCConfig(
+        address=settings.address,
+        rack=settings.rack,
+        slot=settings.slot,
+        tcp_port=settings.tcp_port,
     )
 
     with PLCClient(config) as client:
         payload, records = fetch_payload_and_records(
-            client, args.db, args.start, args.size
+            client, settings.db, settings.start, settings.size
         )
-        message = summarise_payload(payload, args.db, args.start, sawlog_records=records)
-        print(message)
+        lines = iter_summary_lines(
+            payload, settings.db, settings.start, sawlog_records=records
+        )
+        sys.stdout.writelines(line + "\n" for line in lines)
 
 
 def launch_gui() -> None:
+    from gui import PLCReaderApp
+
     PLCReaderApp().run()
 
 
@@ -3,27 +3,78 @@
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
-from typing import Dict, Iterable, Optional, Tuple
-
-from snap7 import client as snap7_client
-
-try:
-    from snap7 import types as _snap7_types
-except ImportError:  # python-snap7>=1.3 renames the module to `type`
-    from snap7 import type as _snap7_types  # type: ignore[attr-defined]
-
-try:
-    from snap7.snap7exceptions import Snap7Exception  # python-snap7<=1.2
-except ModuleNotFoundError:  # python-snap7>=1.3 raises RuntimeError instead
-    Snap7Exception = RuntimeError  # type: ignore[misc,assignment]
+import ctypes
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .config import PLCConfig
 from .datatypes import SAWLOG, SawlogsRegisterDB
 
-snap7_types = _snap7_types
+if TYPE_CHECKING:
+    from snap7 import client as snap7_client
+
+# python-snap7 (and its native library) is imported on first connect, so importing
+# this package -- e.g. for `--help` or the datatypes -- stays cheap.
+_snap7_client = None
+_snap7_types = None
+# Set by _load_snap7(); only used on paths that already required a connected client.
+# The public name `Snap7Exception` is resolved on demand by __getattr__ below.
+_snap7_exception: type = RuntimeError
 
 Request = Tuple[int, int, int]
 
+# snap7 sets TCP_NODELAY/SO_KEEPALIVE on its own socket; what we can tune is the PDU
+# size. Large DB reads are split into PDU-sized requests, so asking for the biggest
+# PDU S7 supports (the PLC negotiates it down if needed) saves round trips.
+_PDU_REQUEST_SIZE = 960
+
+# ReadMultiVars limits (S7 protocol): at most 20 items per request, and both the
+# request (12 bytes per item) and the response (4-byte item header + data, padded to
+# an even length) must fit into the negotiated PDU.
+_MULTI_READ_MAX_VARS = 20
+_MULTI_READ_REQ_HEADER = 19
+_MULTI_READ_REQ_ITEM = 12
+_MULTI_READ_RESP_HEADER = 14
+_MULTI_READ_RESP_ITEM = 4
+_S7_AREA_DB = 0x84
+_S7_WL_BYTE = 0x02
+
+_SAWLOG_BYTES = SAWLOG.BYTE_SIZE
+_REGISTER_BYTES = SawlogsRegisterDB.DB_BYTE_SIZE
+
+
+def _load_snap7() -> None:
+    global _snap7_client, _snap7_types, _snap7_exception
+    if _snap7_client is not None:
+        return
+
+    from snap7 import client
+
+    try:
+        from snap7 import types
+    except ImportError:  # python-snap7>=1.3 renames the module to `type`
+        from snap7 import type as types  # type: ignore[attr-defined,no-redef]
+
+    try:
+        from snap7.snap7exceptions import Snap7Exception as exc_type  # python-snap7<=1.2
+    except ModuleNotFoundError:  # python-snap7>=1.3 raises RuntimeError instead
+        exc_type = RuntimeError
+
+    _snap7_types = types
+    _snap7_exception = exc_type
+    _snap7_client = client
+
+
+def __getattr__(name: str):
+    # `snap7_types` and `Snap7Exception` used to be module attributes; keep them
+    # available, loaded on demand (so an early import never binds a placeholder)
+    if name == "snap7_types":
+        _load_snap7()
+        return _snap7_types
+    if name == "Snap7Exception":
+        _load_snap7()
+        return _snap7_exception
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class PLCClient(AbstractContextManager["PLCClient"]):
     """High-level PLC client using the snap7 library."""
@@ -41,6 +92,10 @@ class PLCClient(AbstractContextManager["PLCClient"]):
         self.disconnect()
 
     # -- connection management ----------------------------------------------------
+    @property
+    def config(self) -> PLCConfig:
+        return self._config
+
     @property
     def is_connected(self) -> bool:
         return bool(self._client and self._client.get_connected())
@@ -49,12 +104,19 @@ class PLCClient(AbstractContextManager["PLCClient"]):
         if self.is_connected:
             return
 
-        client = snap7_client.Client()
+        _load_snap7()
+        client = _snap7_client.Client()
         try:
             client.set_connection_type(0x02)  # basic S7 communication
         except AttributeError:
             # Older snap7 releases may not expose set_connection_type; ignore.
             pass
+        try:
+            param = getattr(getattr(_snap7_types, "Parameter", None), "PDURequest", 10)
+            client.set_param(param, _PDU_REQUEST_SIZE)
+        except Exception:
+            # Parameter not supported by this snap7 build; keep the library default.
+            pass
 
         connect_args = (
             self._config.address,
@@ -91,11 +153,13 @@ class PLCClient(AbstractContextManager["PLCClient"]):
         self.ensure_connected()
         assert self._client is not None  # for type-checkers
         try:
-            return bytearray(self._client.db_read(db_number, start, size))
-        except Snap7Exception as exc:
+            data = self._client.db_read(db_number, start, size)
+        except _snap7_exception as exc:
             raise RuntimeError(
                 f"Failed to read DB{db_number} offset {start} size {size}: {exc}"
             ) from exc
+        # python-snap7 already hands back a fresh bytearray; only copy other buffer types
+        return data if isinstance(data, bytearray) else bytearray(data)
 
     def write_db(self, db_number: int, start: int, data: bytes | bytearray) -> None:
         """Write raw bytes to a PLC data block."""
@@ -106,7 +170,7 @@ class PLCClient(AbstractContextManager["PLCClient"]):
             # snap7 expects a bytearray-like buffer
             buf = bytearray(data)
             self._client.db_write(db_number, start, buf)
-        except Snap7Exception as exc:
+        except _snap7_exception as exc:
             raise RuntimeError(
                 f"Failed to write DB{db_number} offset {start} size {len(data)}: {exc}"
             ) from exc
@@ -118,9 +182,9 @@ class PLCClient(AbstractContextManager["PLCClient"]):
         assert self._client is not None
         try:
             return bytearray(
-                self._client.read_area(snap7_types.Areas.PE, 0, start, size)
+                self._client.read_area(_snap7_types.Areas.PE, 0, start, size)
             )
-        except Snap7Exception as exc:
+        except _snap7_exception as exc:
             raise RuntimeError(f"Failed to read inputs: {exc}") from exc
 
     def read_outputs(self, start: int, size: int) -> bytearray:
@@ -130,9 +194,9 @@ class PLCClient(AbstractContextManager["PLCClient"]):
         assert self._client is not None
         try:
             return bytearray(
-                self._client.read_area(snap7_types.Areas.PA, 0, start, size)
+                self._client.read_area(_snap7_types.Areas.PA, 0, start, size)
             )
-        except Snap7Exception as exc:
+        except _snap7_exception as exc:
             raise RuntimeError(f"Failed to read outputs: {exc}") from exc
 
     def read_sawlog_register(
@@ -140,13 +204,20 @@ class PLCClient(AbstractContextManager["PLCClient"]):
     ) -> SawlogsRegisterDB:
         """Read the full SAWLOG register data block (255 records)."""
 
-        size = SawlogsRegisterDB.DB_BYTE_SIZE
+        return self.read_sawlog_register_raw(db_number, start)[1]
+
+    def read_sawlog_register_raw(
+        self, db_number: int = 200, start: int = 0
+    ) -> Tuple[bytearray, SawlogsRegisterDB]:
+        """Read the full SAWLOG register and return (raw bytes, parsed register)."""
+
+        size = _REGISTER_BYTES
         payload = self.read_db(db_number, start, size)
         if len(payload) != size:
             raise RuntimeError(
                 f"Expected {size} bytes when reading SAWLOG register, received {len(payload)}"
             )
-        return SawlogsRegisterDB.from_bytes(bytes(payload))
+        return payload, SawlogsRegisterDB.from_bytes(payload)
 
     def write_sawlog_record(
         self, db_number: int, index: int, record: SAWLOG, *, start: int = 0
@@ -155,10 +226,93 @@ class PLCClient(AbstractContextManager["PLCClient"]):
 
         if index < 0:
             raise ValueError("index must be non-negative")
-        offset = start + index * SAWLOG.BYTE_SIZE
+        offset = start + index * _SAWLOG_BYTES
         self.write_db(db_number, offset, record.to_bytes())
 
-    def bulk_read(self, requests: Iterable[Request]) -> Dict[Request, bytearray]:
-        """Perform multiple DB reads and return a mapping of request -> bytes."""
+    def bulk_read(self, requests: Iterable[Request]) -> List[bytearray]:
+        """Perform multiple DB reads; returns the payloads in request order.
+
+        Requests small enough to share a PDU are batched into ReadMultiVars calls (one
+        round trip per batch); larger ones fall back to ``read_db``. Duplicate requests
+        each get their own entry.
+        """
 
-        return {request: self.read_db(*request) for request in requests}
+        requests = list(requests)
+        self.ensure_connected()
+        assert self._client is not None
+        data_item = getattr(_snap7_types, "S7DataItem", None)
+        if data_item is None or not hasattr(self._client, "read_multi_vars"):
+            return [self.read_db(*request) for request in requests]
+
+        try:
+            pdu_length = int(self._client.get_pdu_length())
+        except Exception:
+            pdu_length = 240  # smallest PDU any S7 CPU negotiates
+        req_budget = pdu_length - _MULTI_READ_REQ_HEADER
+        resp_budget = pdu_length - _MULTI_READ_RESP_HEADER
+
+        results: List[bytearray] = [None] * len(requests)  # type: ignore[list-item]
+        batch: List[int] = []  # indices into requests
+        used = 0
+
+        def flush() -> None:
+            payloads = self._read_multi(data_item, [requests[i] for i in batch])
+            for i, payload in zip(batch, payloads):
+                results[i] = payload
+
+        for index, request in enumerate(requests):
+            size = request[2]
+            cost = _MULTI_READ_RESP_ITEM + size + (size & 1)
+            if cost > resp_budget:
+                results[index] = self.read_db(*request)
+                continue
+            if (
+                len(batch) == _MULTI_READ_MAX_VARS
+                or used + cost > resp_budget
+                or (len(batch) + 1) * _MULTI_READ_REQ_ITEM > req_budget
+            ):
+                flush()
+                batch = []
+                used = 0
+            batch.append(index)
+            used += cost
+        if batch:
+            flush()
+        return results
+
+    def bulk_read_dict(self, requests: Iterable[Request]) -> Dict[Request, bytearray]:
+        """Like ``bulk_read`` but return a mapping of request -> bytes."""
+
+        requests = list(requests)
+        return dict(zip(requests, self.bulk_read(requests)))
+
+    def _read_multi(self, data_item, batch: Sequence[Request]) -> List[bytearray]:
+        """Read a PDU-sized batch of DB ranges with a single ReadMultiVars call."""
+
+        assert self._client is not None
+        items = (data_item * len(batch))()
+        buffers = []
+        for item, (db_number, start, size) in zip(items, batch):
+            buffer = ctypes.create_string_buffer(max(size, 1))
+            buffers.append(buffer)  # keep alive until the call returns
+            item.Area = _S7_AREA_DB
+            item.WordLen = _S7_WL_BYTE
+            item.Result = 0
+            item.DBNumber = db_number
+            item.Start = start
+            item.Amount = size
+            item.pData = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_uint8))
+        try:
+            self._client.read_multi_vars(items)
+        except _snap7_exception as exc:
+            raise RuntimeError(f"Failed to read {len(batch)} DB range(s): {exc}") from exc
+
+        payloads = []
+        for item, buffer, (db_number, start, size) in zip(items, buffers, batch):
+            if item.Result != 0:
+                raise RuntimeError(
+                    f"Failed to read DB{db_number} offset {start} size {size}: "
+                    f"item error 0x{item.Result:X}"
+                )
+            payloads.append(bytearray(buffer.raw[:size]))
+        return payloads
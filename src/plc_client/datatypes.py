@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache
+from itertools import compress
 import struct
-from typing import ClassVar, Iterable, Tuple
+from typing import TYPE_CHECKING, ClassVar, Iterable, Tuple
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+# Byte value -> its 8 flags (bit0 first); flag words are unpacked one byte at a time.
+# A 16-bit table would save one concat per word but costs ~12 MB and 0.1 s at import.
+_FLAGS8_LUT: Tuple[Tuple[bool, ...], ...] = tuple(
+    tuple(bool(value & (1 << bit)) for bit in range(8)) for value in range(256)
+)
+
+# Bit value of each flag position; sum(compress(_FLAG_BITS, flags)) packs without a loop
+_FLAG_BITS: Tuple[int, ...] = tuple(1 << bit for bit in range(32))
+
+
+@dataclass(frozen=True, slots=True)
 class DTL:
     """Represents the Siemens S7 DTL (Date and Time) structure."""
 
@@ -45,27 +59,32 @@ class DTL:
             raise ValueError(
                 f"DTL payload must be {cls._STRUCT.size} bytes, got {len(payload)}"
             )
-        year, month, day, weekday, hour, minute, second, nanosecond = cls._STRUCT.unpack(
-            payload
-        )
-        return cls(year, month, day, weekday, hour, minute, second, nanosecond)
+        return cls(*cls._STRUCT.unpack(payload))
 
     def to_datetime(self) -> datetime:
         """Convert to a Python datetime (nanoseconds truncated to microseconds)."""
 
-        microseconds = self.nanosecond // 1000
-        return datetime(
-            year=self.year,
-            month=self.month,
-            day=self.day,
-            hour=self.hour,
-            minute=self.minute,
-            second=self.second,
-            microsecond=microseconds,
+        return _dtl_to_datetime(
+            self.year, self.month, self.day, self.hour, self.minute, self.second,
+            self.nanosecond // 1000,
         )
 
 
-@dataclass(frozen=True)
+# Records in one register often share timestamps, and the GUI converts them on every
+# refresh; datetimes are immutable, so equal DTL values can share one instance.
+@lru_cache(maxsize=512)
+def _dtl_to_datetime(
+    year: int, month: int, day: int, hour: int, minute: int, second: int, microsecond: int
+) -> datetime:
+    return datetime(year, month, day, hour, minute, second, microsecond)
+
+
+@lru_cache(maxsize=512)
+def _dtl_iso(dtl: DTL) -> str:
+    return dtl.to_datetime().isoformat(sep=" ")
+
+
+@dataclass(frozen=True, slots=True)
 class SAWLOG:
     """Represents the SAWLOG structure.
 
@@ -78,8 +97,9 @@ class SAWLOG:
     - drop_box_number: U16
     - flags_0: 16 boolean flags packed into 2 bytes (bit0 = FL0)
     - flags_1: 16 boolean flags packed into 2 bytes (bit0 = FL16)
+               (kept here as one 32-bit int: flags_0 | flags_1 << 16)
     - buttons: Byte[2][32] => 64 bytes total, first 32 then second 32
-               (kept here as a flat tuple of 64 bytes: orders[32] + counts[32])
+               (kept here as one flat 64-byte ``bytes``: orders[32] + counts[32])
     - timestamp: DTL (12 bytes)
     """
 
@@ -89,10 +109,11 @@ class SAWLOG:
     length: int
     position: int
     drop_box_number: int
-    # 32 flags total, flattened FL0..FL31
-    flags: Tuple[bool, ...]
-    # buttons stored as 64 raw bytes: first 32, then 32 (e.g. orders[32] + counts[32])
-    buttons: Tuple[int, ...]
+    # 32 flags as one bitset, bit i = FLi (the constructor also accepts 32 bools)
+    flags: int
+    # buttons stored as 64 raw bytes: first 32, then 32 (e.g. orders[32] + counts[32]);
+    # the constructor also accepts any sequence of 64 ints in 0-255
+    buttons: bytes
     timestamp: DTL
 
     FLAGS_COUNT: ClassVar[int] = 32
@@ -114,152 +135,288 @@ class SAWLOG:
     LEGACY_BYTE_SIZE: ClassVar[int] = (
         _LEGACY_HEADER_STRUCT.size + _LEGACY_FLAGS_SIZE + _LEGACY_BUTTONS_SIZE + DTL._STRUCT.size
     )
+    # Whole record in one format: header, flags_0, flags_1, buttons (raw), DTL fields.
+    # Decoding is a single C call per record; what remains in Python is building the
+    # record objects (~3 us each), so a compiled parser would not pay for a build step.
+    _RECORD_STRUCT: ClassVar[struct.Struct] = struct.Struct(
+        ">IBBHIH" + "HH" + f"{_BUTTONS_BYTE_SIZE}s" + "H6BI"
+    )
+    # Legacy record in one format: header, flags (one word), interleaved buttons, DTL fields
+    _LEGACY_RECORD_STRUCT: ClassVar[struct.Struct] = struct.Struct(
+        ">IBBHH" + "H" + f"{_LEGACY_BUTTONS_SIZE}s" + "H6BI"
+    )
 
     def __post_init__(self) -> None:
-        flags = tuple(bool(flag) for flag in self.flags)
-        if len(flags) != self.FLAGS_COUNT:
-            raise ValueError(f"flags must contain {self.FLAGS_COUNT} entries")
+        flags = self.flags
+        if isinstance(flags, bool):
+            raise ValueError("flags must be an int or a sequence of 32 booleans, not a bool")
+        if not isinstance(flags, int):
+            try:
+                flags = tuple(flags)
+            except TypeError as exc:
+                raise ValueError("flags must be an int or a sequence of 32 booleans") from exc
+            if len(flags) != self.FLAGS_COUNT:
+                raise ValueError(f"flags must contain {self.FLAGS_COUNT} entries")
+            flags = sum(compress(_FLAG_BITS, flags))
+        if flags & ~0xFFFFFFFF:
+            raise ValueError("flags must fit in 32 bits")
         object.__setattr__(self, "flags", flags)
 
-        buttons = tuple(int(button) for button in self.buttons)
+        buttons = self.buttons
+        if not isinstance(buttons, bytes):
+            try:
+                # iter() so a bare int is rejected instead of meaning "n zero bytes"
+                buttons = bytes(iter(buttons))
+            except (TypeError, ValueError) as exc:
+                raise ValueError("buttons must be 64 integers in range 0-255") from exc
         if len(buttons) != self._BUTTONS_BYTE_SIZE:
             raise ValueError(
                 f"buttons must contain {self._BUTTONS_BYTE_SIZE} entries (32 + 32)"
             )
-        if any(button < 0 or button > 0xFF for button in buttons):
-            raise ValueError("button bytes must be in range 0-255")
         object.__setattr__(self, "buttons", buttons)
 
-        if self.id < 0:
-            raise ValueError("id must be non-negative")
-        if not (0 <= self.zone_id <= 0xFF):
+        # bool is an int subclass, so True/False would otherwise pass the range checks
+        for name in ("id", "zone_id", "sensor_id", "length", "position", "drop_box_number"):
+            value = getattr(self, name)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError(f"{name} must be an int, got {type(value).__name__}")
+
+        # x & ~MAX is non-zero for anything above MAX and for every negative int
+        if self.id & ~0xFFFFFFFF:
+            raise ValueError("id must fit in an unsigned double word")
+        if self.zone_id & ~0xFF:
             raise ValueError("zone_id must fit in an unsigned byte")
-        if not (0 <= self.sensor_id <= 0xFF):
+        if self.sensor_id & ~0xFF:
             raise ValueError("sensor_id must fit in an unsigned byte")
-        if not (0 <= self.length <= 0xFFFF):
+        if self.length & ~0xFFFF:
             raise ValueError("length must fit in an unsigned word")
-        if not (0 <= self.position <= 0xFFFFFFFF):
+        if self.position & ~0xFFFFFFFF:
             raise ValueError("position must fit in an unsigned double word")
-        if not (0 <= self.drop_box_number <= 0xFFFF):
+        if self.drop_box_number & ~0xFFFF:
             raise ValueError("drop_box_number must fit in an unsigned word")
 
+    @property
+    def flags_word(self) -> int:
+        """Alias of ``flags``, kept for callers written against the tuple form."""
+
+        return self.flags
+
+    @property
+    def flags_tuple(self) -> Tuple[bool, ...]:
+        """The 32 flags as booleans, FL0 first."""
+
+        flags = self.flags
+        return self._flags_from_words(flags & 0xFFFF, flags >> 16)
+
+    @property
+    def buttons_tuple(self) -> Tuple[int, ...]:
+        """The 64 button bytes as a tuple of ints."""
+
+        return tuple(self.buttons)
+
+    def flag(self, index: int) -> bool:
+        """Return flag FL<index>."""
+
+        if not (0 <= index < self.FLAGS_COUNT):
+            raise IndexError(f"flag index must be in range 0-{self.FLAGS_COUNT - 1}")
+        return bool((self.flags >> index) & 1)
+
+    def with_flag(self, index: int, value: bool) -> "SAWLOG":
+        """Return a copy of this record with flag FL<index> set to ``value``."""
+
+        if not (0 <= index < self.FLAGS_COUNT):
+            raise IndexError(f"flag index must be in range 0-{self.FLAGS_COUNT - 1}")
+        bit = 1 << index
+        return replace(self, flags=(self.flags | bit) if value else (self.flags & ~bit))
+
+    @property
+    def iso_timestamp(self) -> str:
+        """Timestamp formatted as ISO 8601 with a space separator (cached per DTL)."""
+
+        return _dtl_iso(self.timestamp)
+
     def to_bytes(self) -> bytes:
         """Serialize the structure into the packed PLC representation."""
 
-        header = self._HEADER_STRUCT.pack(
+        return self._RECORD_STRUCT.pack(*self._record_fields())
+
+    def pack_into(self, buffer: bytearray | memoryview, offset: int = 0) -> None:
+        """Write the packed PLC representation into ``buffer`` at ``offset``."""
+
+        self._RECORD_STRUCT.pack_into(buffer, offset, *self._record_fields())
+
+    def _record_fields(self) -> tuple:
+        """Field values in ``_RECORD_STRUCT`` order."""
+
+        word = self.flags
+        ts = self.timestamp
+        return (
             self.id,
             self.zone_id,
             self.sensor_id,
             self.length,
             self.position,
             self.drop_box_number,
+            word & 0xFFFF,
+            word >> 16,
+            self.buttons,
+            ts.year,
+            ts.month,
+            ts.day,
+            ts.weekday,
+            ts.hour,
+            ts.minute,
+            ts.second,
+            ts.nanosecond,
         )
-        flags_bytes = self._pack_flags(self.flags)
-        buttons_bytes = self._pack_buttons(self.buttons)
-        return header + flags_bytes + buttons_bytes + self.timestamp.to_bytes()
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> "SAWLOG":
-        """Parse the SAWLOG structure from its packed PLC representation."""
-
-        if len(payload) != cls.BYTE_SIZE:
-            raise ValueError(f"SAWLOG payload must be {cls.BYTE_SIZE} bytes, got {len(payload)}")
-
-        offset = 0
-        header = cls._HEADER_STRUCT.unpack_from(payload, offset)
-        offset += cls._HEADER_STRUCT.size
-
-        flags_bytes = payload[offset : offset + cls._FLAGS_BYTE_SIZE]
-        offset += cls._FLAGS_BYTE_SIZE
-
-        buttons_bytes = payload[offset : offset + cls._BUTTONS_BYTE_SIZE]
-        offset += cls._BUTTONS_BYTE_SIZE
-
-        timestamp_bytes = payload[offset : offset + DTL._STRUCT.size]
-
-        flags = cls._unpack_flags(flags_bytes)
-        buttons = cls._unpack_buttons(buttons_bytes)
-        timestamp = DTL.from_bytes(timestamp_bytes)
-
-        return cls(
-            id=header[0],
-            zone_id=header[1],
-            sensor_id=header[2],
-            length=header[3],
-            position=header[4],
-            drop_box_number=header[5],
-            flags=flags,
-            buttons=buttons,
-            timestamp=timestamp,
+    def from_bytes(
+        cls, payload: bytes | bytearray | memoryview, offset: int | None = None
+    ) -> "SAWLOG":
+        """Parse the SAWLOG structure from its packed PLC representation.
+
+        Without ``offset`` the payload must be exactly one record. With an ``offset``
+        (including 0) the record is read in place from a larger buffer (e.g. the
+        register DB) without slicing it out first.
+        """
+
+        offset = cls._check_span(payload, offset, cls.BYTE_SIZE, "SAWLOG")
+        return cls._from_fields(cls._RECORD_STRUCT.unpack_from(payload, offset))
+
+    @staticmethod
+    def _check_span(
+        payload: bytes | bytearray | memoryview, offset: int | None, size: int, what: str
+    ) -> int:
+        """Validate the record span and return the offset to unpack from."""
+
+        if offset is None:
+            if len(payload) != size:
+                raise ValueError(f"{what} payload must be {size} bytes, got {len(payload)}")
+            return 0
+        if offset < 0 or offset + size > len(payload):
+            raise ValueError(
+                f"{what} record at offset {offset} exceeds payload of {len(payload)} bytes"
+            )
+        return offset
+
+    @classmethod
+    def _from_fields(cls, fields: tuple) -> "SAWLOG":
+        """Build a SAWLOG from one ``_RECORD_STRUCT`` unpack result."""
+
+        (
+            id_,
+            zone_id,
+            sensor_id,
+            length,
+            position,
+            drop_box_number,
+            flags_low,
+            flags_high,
+            buttons,
+            *timestamp,
+        ) = fields
+        return cls._new_trusted(
+            id_,
+            zone_id,
+            sensor_id,
+            length,
+            position,
+            drop_box_number,
+            flags_low | (flags_high << 16),
+            buttons,
+            DTL(*timestamp),
         )
 
+    @classmethod
+    def _new_trusted(
+        cls,
+        id: int,
+        zone_id: int,
+        sensor_id: int,
+        length: int,
+        position: int,
+        drop_box_number: int,
+        flags: int,
+        buttons: bytes,
+        timestamp: DTL,
+    ) -> "SAWLOG":
+        """Create an instance without running ``__post_init__`` validation.
+
+        Only for values unpacked from the fixed PLC layouts, whose struct formats already
+        bound every field; the normal constructor always validates.
+        """
+
+        obj = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, "id", id)
+        setattr_(obj, "zone_id", zone_id)
+        setattr_(obj, "sensor_id", sensor_id)
+        setattr_(obj, "length", length)
+        setattr_(obj, "position", position)
+        setattr_(obj, "drop_box_number", drop_box_number)
+        setattr_(obj, "flags", flags)
+        setattr_(obj, "buttons", buttons)
+        setattr_(obj, "timestamp", timestamp)
+        return obj
+
     @classmethod
     def from_iterable(cls, payloads: Iterable[bytes]) -> Tuple["SAWLOG", ...]:
         """Create SAWLOG instances from an iterable of raw payloads."""
 
-        return tuple(cls.from_bytes(payload) for payload in payloads)
+        return tuple(map(cls.from_bytes, payloads))
 
     @classmethod
-    def array_from_bytes(cls, payload: bytes) -> Tuple["SAWLOG", ...]:
-        """Convert a raw byte buffer into SAWLOG records."""
+    def array_from_bytes(cls, payload: bytes | bytearray | memoryview) -> Tuple["SAWLOG", ...]:
+        """Convert a raw byte buffer (any bytes-like object, not copied) into SAWLOG records."""
 
         if len(payload) % cls.BYTE_SIZE != 0:
             raise ValueError(
                 f"Payload length {len(payload)} is not a multiple of SAWLOG size {cls.BYTE_SIZE}"
             )
-        records = []
-        view = memoryview(payload)
-        for offset in range(0, len(payload), cls.BYTE_SIZE):
-            chunk = view[offset : offset + cls.BYTE_SIZE]
-            records.append(cls.from_bytes(bytes(chunk)))
-        return tuple(records)
+        # One precompiled struct walks the whole buffer in C; Python only builds objects
+        return tuple(map(cls._from_fields, cls._RECORD_STRUCT.iter_unpack(payload)))
 
     # -- compatibility helpers -------------------------------------------------
     @classmethod
-    def from_legacy_bytes(cls, payload: bytes) -> "SAWLOG":
+    def from_legacy_bytes(
+        cls, payload: bytes | bytearray | memoryview, offset: int | None = None
+    ) -> "SAWLOG":
         """Parse the legacy 88-byte SAWLOG and map to the new shape.
 
         - sensor_id stays U8
         - position is set to 0 (field did not exist)
-        - 16 flags are padded with another 16 as False
+        - the 16 flags become FL0..FL15; FL16..FL31 are False
         - buttons are converted from interleaved pairs to [first32 + next32]
         """
 
-        if len(payload) != cls.LEGACY_BYTE_SIZE:
-            raise ValueError("legacy SAWLOG payload must be 88 bytes")
-        off = 0
-        h = cls._LEGACY_HEADER_STRUCT.unpack_from(payload, off)
-        off += cls._LEGACY_HEADER_STRUCT.size
-        flags2 = payload[off : off + cls._LEGACY_FLAGS_SIZE]
-        off += cls._LEGACY_FLAGS_SIZE
-        buttons_inter = payload[off : off + cls._LEGACY_BUTTONS_SIZE]
-        off += cls._LEGACY_BUTTONS_SIZE
-        ts = DTL.from_bytes(payload[off : off + DTL._STRUCT.size])
-
-        # flags: 16 bits -> pad to 32
-        val = int.from_bytes(flags2, byteorder="big")
-        flags0 = tuple(bool(val & (1 << i)) for i in range(16))
-        flags_full = flags0 + (False,) * 16
-
-        # buttons: interleaved -> first32 + next32
-        orders = [buttons_inter[2 * i] for i in range(32)]
-        counts = [buttons_inter[2 * i + 1] for i in range(32)]
-        buttons_new = tuple(int(b) for b in (orders + counts))
-
-        return cls(
-            id=h[0],
-            zone_id=h[1],
-            sensor_id=h[2],
-            length=h[3],
-            position=0,
-            drop_box_number=h[4],
-            flags=flags_full,
-            buttons=buttons_new,
-            timestamp=ts,
+        offset = cls._check_span(payload, offset, cls.LEGACY_BYTE_SIZE, "legacy SAWLOG")
+        return cls._from_legacy_fields(cls._LEGACY_RECORD_STRUCT.unpack_from(payload, offset))
+
+    @classmethod
+    def _from_legacy_fields(cls, fields: tuple) -> "SAWLOG":
+        """Build a SAWLOG from one ``_LEGACY_RECORD_STRUCT`` unpack result."""
+
+        id_, zone_id, sensor_id, length, drop_box_number, flags16, buttons_inter, *timestamp = (
+            fields
+        )
+        # buttons: interleaved (order, count) pairs -> first32 + next32
+        return cls._new_trusted(
+            id_,
+            zone_id,
+            sensor_id,
+            length,
+            0,
+            drop_box_number,
+            flags16,
+            buttons_inter[0::2] + buttons_inter[1::2],
+            DTL(*timestamp),
         )
 
     @classmethod
-    def array_from_bytes_compat(cls, payload: bytes) -> Tuple["SAWLOG", ...]:
+    def array_from_bytes_compat(
+        cls, payload: bytes | bytearray | memoryview
+    ) -> Tuple["SAWLOG", ...]:
         """Parse as new layout (94B) when possible, otherwise legacy (88B)."""
 
         if len(payload) == 0:
@@ -267,68 +424,51 @@ class SAWLOG:
         if len(payload) % cls.BYTE_SIZE == 0:
             return cls.array_from_bytes(payload)
         if len(payload) % cls.LEGACY_BYTE_SIZE == 0:
-            recs = []
-            view = memoryview(payload)
-            for offset in range(0, len(payload), cls.LEGACY_BYTE_SIZE):
-                chunk = view[offset : offset + cls.LEGACY_BYTE_SIZE]
-                recs.append(cls.from_legacy_bytes(bytes(chunk)))
-            return tuple(recs)
+            return tuple(
+                map(cls._from_legacy_fields, cls._LEGACY_RECORD_STRUCT.iter_unpack(payload))
+            )
         raise ValueError("payload length is neither a multiple of 94 nor 88 bytes")
 
     @staticmethod
-    def _pack_flags(flags: Tuple[bool, ...]) -> bytes:
-        if len(flags) != SAWLOG.FLAGS_COUNT:
-            raise ValueError("flags payload must have 32 entries")
-        # two words, big-endian; lower 16 bits = FL0..15, upper 16 bits = FL16..31
-        low = 0
-        high = 0
-        for index in range(16):
-            if flags[index]:
-                low |= 1 << index
-        for index in range(16, 32):
-            if flags[index]:
-                high |= 1 << (index - 16)
-        return low.to_bytes(2, byteorder="big") + high.to_bytes(2, byteorder="big")
-
-    @staticmethod
-    def _unpack_flags(payload: bytes) -> Tuple[bool, ...]:
-        if len(payload) != SAWLOG._FLAGS_BYTE_SIZE:
-            raise ValueError("flags payload has invalid length")
-        low = int.from_bytes(payload[0:2], byteorder="big")
-        high = int.from_bytes(payload[2:4], byteorder="big")
-        flags0 = tuple(bool(low & (1 << i)) for i in range(16))
-        flags1 = tuple(bool(high & (1 << i)) for i in range(16))
-        return flags0 + flags1
+    def _flags_from_words(low: int, high: int) -> Tuple[bool, ...]:
+        lut = _FLAGS8_LUT
+        return lut[low & 0xFF] + lut[low >> 8] + lut[high & 0xFF] + lut[high >> 8]
 
-    @staticmethod
-    def _pack_buttons(buttons: Tuple[int, ...]) -> bytes:
-        # buttons represent 64 raw bytes: first 32 then 32
-        if len(buttons) != SAWLOG._BUTTONS_BYTE_SIZE:
-            raise ValueError("buttons payload has invalid length")
-        return bytes(byte & 0xFF for byte in buttons)
 
-    @staticmethod
-    def _unpack_buttons(payload: bytes) -> Tuple[int, ...]:
-        if len(payload) != SAWLOG._BUTTONS_BYTE_SIZE:
-            raise ValueError("buttons payload has invalid length")
-        # Return as 64 raw bytes: first 32 then next 32
-        return tuple(int(b) for b in payload)
+# Values per record in _RECORD_STRUCT, used to regroup whole-register unpacks
+_SAWLOG_FIELD_COUNT = len(SAWLOG._RECORD_STRUCT.unpack(bytes(SAWLOG.BYTE_SIZE)))
 
 
 @dataclass(frozen=True)
 class SawlogsRegisterDB:
     """Represents the full SAWLOG register data block (255 records)."""
 
+    # Slots written by hand so the caches below are not dataclass fields (they stay out
+    # of fields(), asdict(), eq and pickle): _raw holds the packed bytes the records were
+    # parsed from or last serialized to, _columns the numpy view over them. The records
+    # are immutable, so both stay in sync.
+    __slots__ = ("records", "_raw", "_columns")
+
     records: Tuple[SAWLOG, ...]
 
     CAPACITY: ClassVar[int] = 255
     DB_BYTE_SIZE: ClassVar[int] = CAPACITY * SAWLOG.BYTE_SIZE
+    # The whole register as one format (the record format repeated CAPACITY times), so
+    # packing or unpacking all records is a single C call
+    _DB_STRUCT: ClassVar[struct.Struct] = struct.Struct(
+        ">" + SAWLOG._RECORD_STRUCT.format.lstrip(">") * CAPACITY
+    )
 
     def __post_init__(self) -> None:
         normalized = tuple(self.records)
         if len(normalized) != self.CAPACITY:
             raise ValueError(f"records must contain exactly {self.CAPACITY} SAWLOG entries")
         object.__setattr__(self, "records", normalized)
+        object.__setattr__(self, "_raw", None)
+        object.__setattr__(self, "_columns", None)
+
+    def __reduce__(self):
+        return (type(self), (self.records,))
 
     def __iter__(self):  # type: ignore[override]
         return iter(self.records)
@@ -336,19 +476,155 @@ class SawlogsRegisterDB:
     def to_bytes(self) -> bytes:
         """Serialize the entire register array to bytes."""
 
-        return b"".join(record.to_bytes() for record in self.records)
+        raw = self._raw
+        if raw is None:
+            fields: list = []
+            extend = fields.extend
+            for record in self.records:
+                extend(record._record_fields())
+            raw = self._DB_STRUCT.pack(*fields)
+            object.__setattr__(self, "_raw", raw)
+        return raw
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> "SawlogsRegisterDB":
+    def from_bytes(cls, payload: bytes | bytearray | memoryview) -> "SawlogsRegisterDB":
         """Create a register array from raw bytes."""
 
         if len(payload) != cls.DB_BYTE_SIZE:
             raise ValueError(
                 f"Payload must be {cls.DB_BYTE_SIZE} bytes for {cls.CAPACITY} SAWLOG entries; got {len(payload)}"
             )
-        records = SAWLOG.array_from_bytes(payload)
-        if len(records) != cls.CAPACITY:
+        flat = iter(cls._DB_STRUCT.unpack(payload))
+        # zip over one shared iterator regroups the flat values per record
+        per_record = zip(*[flat] * _SAWLOG_FIELD_COUNT)
+        register = cls(tuple(map(SAWLOG._from_fields, per_record)))
+        # Keep an immutable copy for to_bytes/columns; read_db hands over a bytearray the
+        # caller may reuse, and copying it is far cheaper than re-packing 255 records
+        object.__setattr__(register, "_raw", bytes(payload))
+        return register
+
+    # -- numpy views (optional dependency) ------------------------------------------
+    @classmethod
+    def as_numpy(cls, payload: bytes | bytearray | memoryview) -> "np.ndarray":
+        """View the register bytes as a numpy structured array (255 rows, zero-copy).
+
+        Fields follow the SAWLOG layout: id, zone_id, sensor_id, length, position,
+        drop_box_number, flags_0, flags_1, buttons (64 x u8), then the DTL fields
+        (year, month, day, weekday, hour, minute, second, nanosecond). The array shares
+        memory with ``payload`` (it aliases the caller's buffer, so later writes to a
+        bytearray show through) and is read-only for immutable buffers. For a parsed
+        register, ``columns()`` and the per-field accessors reuse its own bytes.
+        """
+
+        if len(payload) != cls.DB_BYTE_SIZE:
             raise ValueError(
-                f"Expected {cls.CAPACITY} SAWLOG entries, parsed {len(records)}"
+                f"Payload must be {cls.DB_BYTE_SIZE} bytes for {cls.CAPACITY} SAWLOG entries; got {len(payload)}"
             )
-        return cls(records)
+        np = _import_numpy()
+        return np.frombuffer(payload, dtype=_numpy_record_dtype(), count=cls.CAPACITY)
+
+    @staticmethod
+    def flags_array(records: "np.ndarray") -> "np.ndarray":
+        """Unpack the flags of a structured array into an (N, 32) bool array (column i = FLi)."""
+
+        np = _import_numpy()
+        words = records["flags_0"].astype("<u4") | (records["flags_1"].astype("<u4") << 16)
+        # Little-endian bytes + little bit order => column i is bit i of the word
+        raw = words.view(np.uint8).reshape(len(records), 4)
+        return np.unpackbits(raw, axis=1, bitorder="little").view(bool)
+
+    @staticmethod
+    def store_flags_array(records: "np.ndarray", flags: "np.ndarray") -> None:
+        """Pack an (N, 32) bool array back into the flag words of ``records`` in place.
+
+        The inverse of ``flags_array``. With a view from ``as_numpy`` over a bytearray
+        this updates the register bytes directly, ready for ``PLCClient.write_db``.
+        """
+
+        np = _import_numpy()
+        flags = np.asarray(flags, dtype=bool)
+        if flags.shape != (len(records), SAWLOG.FLAGS_COUNT):
+            raise ValueError(
+                f"flags must have shape ({len(records)}, {SAWLOG.FLAGS_COUNT}), got {flags.shape}"
+            )
+        words = np.packbits(flags, axis=1, bitorder="little").view("<u4").ravel()
+        records["flags_0"] = words & 0xFFFF
+        records["flags_1"] = words >> 16
+
+    # -- column (SoA) accessors over this register's bytes ----------------------------
+    def columns(self) -> "np.ndarray":
+        """Read-only structured array over this register's packed bytes (built once)."""
+
+        columns = self._columns
+        if columns is None:
+            columns = self.as_numpy(self.to_bytes())
+            object.__setattr__(self, "_columns", columns)
+        return columns
+
+    def ids(self) -> "np.ndarray":
+        """``id`` of every record as a strided view (no copy)."""
+
+        return self.columns()["id"]
+
+    def positions(self) -> "np.ndarray":
+        """``position`` of every record as a strided view (no copy)."""
+
+        return self.columns()["position"]
+
+    def lengths(self) -> "np.ndarray":
+        """``length`` of every record as a strided view (no copy)."""
+
+        return self.columns()["length"]
+
+    def flags_bits(self) -> "np.ndarray":
+        """The 32-bit flags word of every record (bit i = FLi), like ``SAWLOG.flags``."""
+
+        columns = self.columns()
+        return columns["flags_0"].astype("=u4") | (columns["flags_1"].astype("=u4") << 16)
+
+    def flag_popcount(self) -> "np.ndarray":
+        """Number of set flags per record."""
+
+        np = _import_numpy()
+        bits = self.flags_bits()
+        if hasattr(np, "bitwise_count"):  # numpy>=2.0: hardware popcount
+            return np.bitwise_count(bits)
+        return self.flags_array(self.columns()).sum(axis=1, dtype="u1")
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # numpy is optional; only the array views need it
+        raise ImportError("numpy is required for the SAWLOG array views") from exc
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def _numpy_record_dtype() -> "np.dtype":
+    """Structured dtype matching one packed SAWLOG record."""
+
+    np = _import_numpy()
+    dtype = np.dtype(
+        [
+            ("id", ">u4"),
+            ("zone_id", "u1"),
+            ("sensor_id", "u1"),
+            ("length", ">u2"),
+            ("position", ">u4"),
+            ("drop_box_number", ">u2"),
+            ("flags_0", ">u2"),
+            ("flags_1", ">u2"),
+            ("buttons", "u1", (SAWLOG._BUTTONS_BYTE_SIZE,)),
+            ("year", ">u2"),
+            ("month", "u1"),
+            ("day", "u1"),
+            ("weekday", "u1"),
+            ("hour", "u1"),
+            ("minute", "u1"),
+            ("second", "u1"),
+            ("nanosecond", ">u4"),
+        ]
+    )
+    assert dtype.itemsize == SAWLOG.BYTE_SIZE
+    return dtype
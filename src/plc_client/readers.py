@@ -1,14 +1,65 @@
 from __future__ import annotations
 
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Iterable, List, Optional, Tuple
 
 from plc_client import PLCClient, SAWLOG, SawlogsRegisterDB
 
 Records = Tuple[SAWLOG, ...]
+Payload = bytes | bytearray | memoryview
+
+_SAWLOG_BYTES = SAWLOG.BYTE_SIZE
+_SAWLOG_LEGACY_BYTES = SAWLOG.LEGACY_BYTE_SIZE
+_REGISTER_BYTES = SawlogsRegisterDB.DB_BYTE_SIZE
+
+
+class ParsedPayloadCache:
+    """Single-entry cache of the most recently parsed read.
+
+    A cyclic reader usually sees identical bytes on consecutive polls; comparing the
+    new payload with the cached one is far cheaper than parsing it again. On a hit the
+    previous records tuple is returned as-is (same object).
+    """
+
+    def __init__(self) -> None:
+        self._key: Hashable = None
+        self._payload: Optional[bytes] = None
+        self._records: Records | None = None
+
+    def parse(
+        self,
+        key: Hashable,
+        payload: Payload,
+        parser: Callable[[Payload], Records | None],
+    ) -> Records | None:
+        if key == self._key and self._payload is not None and payload == self._payload:
+            return self._records
+        records = parser(payload)
+        self._key = key
+        self._payload = bytes(payload)
+        self._records = records
+        return records
+
+
+def _parse_records(payload: Payload) -> Records | None:
+    # Dispatch on size up front rather than letting the parser raise on a mismatch
+    size = len(payload)
+    if size and (size % _SAWLOG_BYTES == 0 or size % _SAWLOG_LEGACY_BYTES == 0):
+        return SAWLOG.array_from_bytes_compat(payload)
+    return None
+
+
+def _parse_register(payload: Payload) -> Records:
+    return SawlogsRegisterDB.from_bytes(payload).records
 
 
 def fetch_payload_and_records(
-    client: PLCClient, db: int, start: int, size: int
+    client: PLCClient,
+    db: int,
+    start: int,
+    size: int,
+    *,
+    cache: ParsedPayloadCache | None = None,
 ):
     """Read from PLC and return (payload, records|None).
 
@@ -16,17 +67,42 @@ def fetch_payload_and_records(
       high-level register API and return both bytes and typed records.
     - Otherwise read raw DB bytes; if the length is a multiple of SAWLOG size, try to
       parse it into SAWLOG records. Return None on parse mismatch.
+    - With a ``cache``, a payload identical to the previous read of the same range is
+      not parsed again; the previous records are returned.
     """
 
-    if start == 0 and size == SawlogsRegisterDB.DB_BYTE_SIZE:
-        register = client.read_sawlog_register(db)
-        return bytearray(register.to_bytes()), register.records
+    full_register = start == 0 and size == _REGISTER_BYTES
+    if full_register and cache is None:
+        payload, register = client.read_sawlog_register_raw(db)
+        return payload, register.records
 
     payload = client.read_db(db, start, size)
-    records: Records | None = None
-    if len(payload) > 0:
-        try:
-            records = SAWLOG.array_from_bytes_compat(bytes(payload))
-        except ValueError:
-            records = None
-    return payload, records
+    if full_register:
+        if len(payload) != size:
+            raise RuntimeError(
+                f"Expected {size} bytes when reading SAWLOG register, received {len(payload)}"
+            )
+        parser = _parse_register
+    else:
+        parser = _parse_records
+    if cache is None:
+        return payload, parser(payload)
+    return payload, cache.parse((db, start, size), payload, parser)
+
+
+def fetch_many(
+    client: PLCClient, jobs: Iterable[Tuple[int, int, int]]
+) -> List[Tuple[bytearray, Records | None]]:
+    """Read several (db, start, size) ranges and return [(payload, records|None), ...].
+
+    Reads stay sequential on the one client (snap7 clients are not thread-safe), but
+    each payload is parsed on a worker thread while the next range is being read;
+    snap7 releases the GIL while it waits on the network.
+    """
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = []
+        for db, start, size in jobs:
+            payload = client.read_db(db, start, size)
+            pending.append((payload, pool.submit(_parse_records, payload)))
+        return [(payload, future.result()) for payload, future in pending]